@@ -1,125 +1,308 @@
-import json
+import asyncio
 import logging
 import mimetypes
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from urllib.parse import urlencode
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 import httpx
+import orjson
 
-from config import resolve_config
+from config import INSERT_CHUNK_SIZE, INSERT_CONCURRENCY, env, resolve_config
 
 logger = logging.getLogger(__name__)
 
+# Short-lived response cache for read-mostly endpoints (see _send_get)
+CACHE_TTL = 1.0
+# Server version and model tags only change on a LightRAG restart
+STATIC_CACHE_TTL = 30.0
+CACHE_MAX_ENTRIES = 128
+
+# POST endpoints that only read; every other POST/DELETE invalidates the response cache
+_READ_ONLY_POSTS = {"/query", "/query/stream", "/documents/paginated", "/api/generate", "/api/chat"}
+
+def dumps_text(obj: Any) -> str:
+    """Compact JSON text for tool output (indented if LIGHTRAG_MCP_PRETTY=1); non-str keys are allowed."""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if env().pretty else 0)
+    return orjson.dumps(obj, option=option).decode()
+
+# Content types for the usual upload formats; anything else goes through mimetypes
+_EXT_CTYPE = {
+    ".pdf": "application/pdf",
+    ".md": "text/markdown",
+    ".txt": "text/plain",
+    ".json": "application/json",
+    ".html": "text/html",
+    ".csv": "text/csv",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# documents_upload_files keeps at most this many uploads (and open files) in flight
+UPLOAD_CONCURRENCY = 8
+
+# Connection pool shared by every request this client makes. The server keeps a
+# single client for its lifetime, so keep-alive sockets are reused across calls.
+_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=15.0)
+
+class _TextBatcher:
+    """Coalesces concurrent insert_text calls into /documents/texts requests."""
+
+    def __init__(self, client: "LightRagHttpClient", max_items: int = 64, max_wait: float = 0.05):
+        self._client = client
+        self._max_items = max_items
+        self._max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(self, text: str, file_source: Optional[str]) -> bytes:
+        """Queue one text and wait for the raw response of the batch it was sent in."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, file_source, fut))
+        return await fut
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_items:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Send in the background so the next batch can fill up meanwhile
+            t = asyncio.create_task(self._flush(batch))
+            self._flushes.add(t)
+            t.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[tuple]) -> None:
+        # file_sources applies to the whole request, so texts with and without one go separately
+        sourced = [b for b in batch if b[1] is not None]
+        unsourced = [b for b in batch if b[1] is None]
+        for group in (sourced, unsourced):
+            if not group:
+                continue
+            payload: Dict[str, Any] = {"texts": [b[0] for b in group]}
+            if group is sourced:
+                payload["file_sources"] = [b[1] for b in group]
+            try:
+                raw = await self._client._post_json("/documents/texts", payload, want_raw=True)
+            except Exception as e:
+                for _, _, fut in group:
+                    if not fut.done():
+                        fut.set_exception(e)
+            else:
+                for _, _, fut in group:
+                    if not fut.done():
+                        fut.set_result(raw)
+
+
 class LightRagHttpClient:
     """Tiny async client for the LightRAG HTTP API (per OpenAPI 0204)."""
 
     def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None, timeout: int = 150):
-        # resolve (CLI/env/.env → defaults)
-        self.base_url, self.api_key, _ = resolve_config()
-        if base_url:
-            self.base_url = base_url.rstrip("/")
-        if api_key is not None:
-            self.api_key = api_key
+        # resolve (CLI/env/.env → defaults); not needed when both were given explicitly
+        if base_url and api_key is not None:
+            self.base_url, self.api_key = base_url.rstrip("/"), api_key
+        else:
+            self.base_url, self.api_key, _ = resolve_config()
+            if base_url:
+                self.base_url = base_url.rstrip("/")
+            if api_key is not None:
+                self.api_key = api_key
         self.timeout = timeout
         self.access_token: Optional[str] = None  # OAuth2 password flow bearer token
-        self.client = httpx.AsyncClient(timeout=self.timeout)
-        logger.info(f"Using LightRAG at: {self.base_url}")
+        self._inflight: Dict[tuple, asyncio.Task] = {}  # (cache gen, key) -> GET on the wire, see _send_get
+        self._cache: OrderedDict[tuple, tuple[float, httpx.Response]] = OrderedDict()  # LRU: key -> (stored_at, response)
+        self._query_cache: OrderedDict[bytes, tuple[float, bytes]] = OrderedDict()  # LRU: request -> (stored_at, raw answer)
+        self._cache_gen = 0  # bumped by cache_clear so in-flight queries don't store stale answers
+        self._batcher = _TextBatcher(self)
+        # Built once: auth only changes on login, which updates the client headers in place
+        self._static_headers = {"Accept": "application/json"}
+        if self.api_key:
+            self._static_headers["X-API-Key"] = self.api_key
+        # Some deployments accept API key via query parameter as per OpenAPI;
+        # httpx merges these client-level params into every request
+        static_params = {"api_key_header_value": self.api_key} if self.api_key else None
+        # HTTP/2 lets concurrent requests (e.g. documents_upload_files) share one connection
+        self.client = httpx.AsyncClient(timeout=self.timeout, limits=_LIMITS, http2=True,
+                                        headers=self._static_headers, params=static_params)
+        logger.info("Using LightRAG at: %s", self.base_url)
         if self.api_key:
             logger.info("API key is set via env/CLI")
 
+    async def warm_up(self) -> None:
+        """Open a keep-alive connection ahead of the first tool call; failures are only logged."""
+        try:
+            await self.health(want_raw=True)
+        except Exception as e:  # best effort; e.g. httpx.InvalidURL is not an HTTPError
+            logger.debug("Warm-up request to %s failed: %s", self.base_url, e)
+
+    async def aclose(self) -> None:
+        self._batcher.close()
+        for task in list(self._inflight.values()):
+            task.cancel()
+        await self.client.aclose()
+
     # ---------------------- low-level helpers -----------------------------
 
-    def _headers(self) -> dict:
-        h = {"Accept": "application/json"}
-        if self.api_key:
-            h["X-API-Key"] = self.api_key
-        if self.access_token:
-            h["Authorization"] = f"Bearer {self.access_token}"
-        return h
-
-    def _params(self, extra: Optional[dict] = None) -> dict:
-        params = dict(extra or {})
-        # Some deployments accept API key via query parameter as per OpenAPI
-        if self.api_key and "api_key_header_value" not in params:
-            params["api_key_header_value"] = self.api_key
-        return params
-
-    def _json_or_text(self, r: httpx.Response) -> str:
+    def _raw_json(self, r: httpx.Response) -> bytes:
+        # Forward the upstream JSON body untouched; wrap anything else like want_obj does.
+        # This is what keeps big payloads (graphs, paginated listings) cheap: they are never parsed.
+        if r.content and r.headers.get("content-type", "").startswith("application/json"):
+            return r.content
+        return orjson.dumps({"raw": r.text})
+
+    def _decode(self, r: httpx.Response, want_obj: bool, want_raw: bool) -> Any:
+        # Single place that turns a response into what the want_* flags ask for; parses at most once
+        if want_raw:
+            return self._raw_json(r)
         try:
-            return json.dumps(r.json(), indent=2, ensure_ascii=False)
-        except Exception:
-            return r.text
+            obj = orjson.loads(r.content)
+        except orjson.JSONDecodeError:
+            return {"raw": r.text} if want_obj else r.text
+        return obj if want_obj else dumps_text(obj)
+
+    def _from_raw(self, raw: bytes, want_obj: bool, want_raw: bool) -> Any:
+        # Shape an already-fetched JSON body the way the want_* flags ask for
+        if want_raw:
+            return raw
+        obj = orjson.loads(raw)
+        return obj if want_obj else dumps_text(obj)
+
+    def cache_clear(self) -> None:
+        """Drop all cached GET responses and query answers."""
+        self._cache.clear()
+        self._query_cache.clear()
+        self._cache_gen += 1
+
+    def _invalidate(self, path: str) -> None:
+        # Called once a write has completed (or failed): clearing before it is sent would let
+        # reads started earlier store pre-write bodies again after the clear
+        if path not in _READ_ONLY_POSTS:
+            self.cache_clear()
+
+    async def _send_get(self, url: str, params: Optional[dict], cache_ttl: float = 0.0) -> httpx.Response:
+        # GETs are read-only, so concurrent identical requests share one round-trip
+        key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self._cache.get(key) if cache_ttl else None
+        if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+            self._cache.move_to_end(key)
+            return cached[1]
+        # Every caller, the one that started the request included, waits on it through a shield,
+        # so cancelling one tool call never cancels the request for the others sharing it.
+        # Requests are only shared within a cache generation: a GET started before a write
+        # finished is never joined by callers that come after it.
+        gen = self._cache_gen
+        inflight_key = (gen, key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_get(url, params, key, cached, cache_ttl, gen))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda t: self._inflight_done(inflight_key, t))
+        return await asyncio.shield(task)
+
+    async def _fetch_get(self, url: str, params: Optional[dict], key: tuple, cached: Optional[tuple], cache_ttl: float, gen: int) -> httpx.Response:
+        # Revalidate an expired entry with its ETag; a 304 lets us keep the cached body
+        etag = cached[1].headers.get("etag") if cached is not None else None
+        r = await self.client.get(url, params=params, headers={"If-None-Match": etag} if etag else None)
+        if r.status_code == 304 and cached is not None:
+            r = cached[1]
+        # Only store if no write completed meanwhile; otherwise this body may predate it
+        if cache_ttl and r.is_success and gen == self._cache_gen:
+            self._cache[key] = (time.monotonic(), r)
+            self._cache.move_to_end(key)
+            if len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return r
+
+    def _inflight_done(self, inflight_key: tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(inflight_key) is task:
+            del self._inflight[inflight_key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved so a failure nobody is waiting for isn't logged
+
+    async def _get(self, path: str, params: Optional[dict] = None, want_obj: bool = False, want_raw: bool = False, cache_ttl: float = 0.0) -> Any:
+        url = f"{self.base_url}{path}"
+        r = await self._send_get(url, params, cache_ttl)
+        r.raise_for_status()
+        return self._decode(r, want_obj, want_raw)
+
+    async def _post_json(self, path: str, payload: dict, params: Optional[dict] = None, want_obj: bool = False, want_raw: bool = False) -> Any:
+        r = await self._send_post_json(path, payload, params)
+        return self._decode(r, want_obj, want_raw)
 
-    async def _get(self, path: str, params: Optional[dict] = None, want_obj: bool = False) -> Any:
+    async def _send_post_json(self, path: str, payload: dict, params: Optional[dict] = None) -> httpx.Response:
+        # Shared by _post_json and callers that need the response body as something other than JSON
         url = f"{self.base_url}{path}"
-        r = await self.client.get(url, headers=self._headers(), params=self._params(params))
+        try:
+            r = await self.client.post(url, json=payload, params=params)
+        finally:
+            self._invalidate(path)
         r.raise_for_status()
-        if want_obj:
-            try:
-                return r.json()
-            except Exception:
-                return {"raw": r.text}
-        return self._json_or_text(r)
+        return r
 
-    async def _post_json(self, path: str, payload: dict, params: Optional[dict] = None, stream: bool = False, want_obj: bool = False) -> Any:
+    async def _post_json_stream(self, path: str, payload: dict, params: Optional[dict] = None) -> AsyncIterator[str]:
+        # Yields each non-empty line as soon as it arrives
         url = f"{self.base_url}{path}"
-        if stream:
-            chunks = []
-            async with self.client.stream("POST", url, json=payload, headers=self._headers(), params=self._params(params)) as r:
+        try:
+            async with self.client.stream("POST", url, json=payload, params=params) as r:
                 r.raise_for_status()
                 async for line in r.aiter_lines():
                     if line:
-                        chunks.append(line)
-            data = "\n".join(chunks)
-            return data if not want_obj else {"raw_stream": data}
+                        yield line
+        finally:
+            self._invalidate(path)
 
-        r = await self.client.post(url, json=payload, headers=self._headers(), params=self._params(params))
-        r.raise_for_status()
-        if want_obj:
-            try:
-                return r.json()
-            except Exception:
-                return {"raw": r.text}
-        return self._json_or_text(r)
-
-    async def _post_multipart(self, path: str, files: List[tuple], params: Optional[dict] = None, want_obj: bool = False) -> Any:
+    async def _post_multipart(self, path: str, files: List[tuple], params: Optional[dict] = None, want_obj: bool = False, want_raw: bool = False) -> Any:
         url = f"{self.base_url}{path}"
-        r = await self.client.post(url, files=files, headers=self._headers(), params=self._params(params))
+        try:
+            r = await self.client.post(url, files=files, params=params)
+        finally:
+            self._invalidate(path)
         r.raise_for_status()
-        if want_obj:
-            try:
-                return r.json()
-            except Exception:
-                return {"raw": r.text}
-        return self._json_or_text(r)
+        return self._decode(r, want_obj, want_raw)
 
-    async def _delete(self, path: str, json_body: Optional[dict] = None, params: Optional[dict] = None, want_obj: bool = False) -> Any:
+    async def _delete(self, path: str, json_body: Optional[dict] = None, params: Optional[dict] = None, want_obj: bool = False, want_raw: bool = False) -> Any:
         url = f"{self.base_url}{path}"
-        r = await self.client.delete(url, headers=self._headers(), params=self._params(params), json=json_body)
+        # AsyncClient.delete() takes no body, so go through request() to send the JSON payload
+        try:
+            r = await self.client.request("DELETE", url, params=params, json=json_body)
+        finally:
+            self._invalidate(path)
         r.raise_for_status()
-        if want_obj:
-            try:
-                return r.json()
-            except Exception:
-                return {"raw": r.text}
-        return self._json_or_text(r)
+        return self._decode(r, want_obj, want_raw)
 
     # ---------------------- auth & health ---------------------------------
 
-    async def health(self, want_obj: bool = False) -> Any:
-        return await self._get("/health", want_obj=want_obj)
+    async def health(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/health", want_obj=want_obj, want_raw=want_raw, cache_ttl=CACHE_TTL)
 
-    async def auth_status(self, want_obj: bool = False) -> Any:
-        return await self._get("/auth-status", want_obj=want_obj)
+    async def auth_status(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/auth-status", want_obj=want_obj, want_raw=want_raw, cache_ttl=CACHE_TTL)
 
     async def login(self, username: str, password: str, scope: str = "", want_obj: bool = False) -> Any:
         url = f"{self.base_url}/login"
-        data = {"username": username, "password": password, "scope": scope}
-        headers = {k: v for k, v in self._headers().items() if k != "Accept"}
-        r = await self.client.post(url, data=data, headers=headers)
+        # Encode the form ourselves; the static client headers already carry Accept/X-API-Key
+        body = urlencode({"username": username, "password": password, "scope": scope}).encode()
+        r = await self.client.post(url, content=body, headers=_FORM_HEADERS)
         r.raise_for_status()
         try:
-            payload = r.json()
+            payload = orjson.loads(r.content)
         except Exception:
             payload = {"raw": r.text}
         # Try to extract bearer token
@@ -131,111 +314,176 @@ class LightRagHttpClient:
                     break
         if token:
             self.access_token = token
-        return payload if want_obj else json.dumps(payload, indent=2, ensure_ascii=False)
+            self.client.headers["Authorization"] = f"Bearer {token}"
+            self.cache_clear()  # cached reads were made with the previous credentials
+        return payload if want_obj else dumps_text(payload)
 
     # ---------------------- documents -------------------------------------
 
-    async def documents_scan(self, want_obj: bool = False) -> Any:
-        return await self._post_json("/documents/scan", payload={}, want_obj=want_obj)
+    async def documents_scan(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._post_json("/documents/scan", payload={}, want_obj=want_obj, want_raw=want_raw)
 
-    async def upload_file(self, file_path: str, want_obj: bool = False) -> Any:
+    async def upload_file(self, file_path: str, want_obj: bool = False, want_raw: bool = False) -> Any:
         p = Path(file_path)
-        if not p.exists() or not p.is_file():
+        if not p.is_file():  # one stat; False for missing paths too
             err = {"error": f"File not found: {file_path}"}
-            return err if want_obj else json.dumps(err)
-        ctype = mimetypes.guess_type(p.name)[0] or "application/octet-stream"
+            if want_raw:
+                return orjson.dumps(err)
+            return err if want_obj else dumps_text(err)
+        ctype = _EXT_CTYPE.get(p.suffix.lower()) or mimetypes.guess_type(p.name)[0] or "application/octet-stream"
+        # Hand httpx the open file so the multipart body is streamed from disk in chunks
         with open(p, "rb") as f:
-            files = [("file", (p.name, f.read(), ctype))]
-            return await self._post_multipart("/documents/upload", files=files, want_obj=want_obj)
+            files = [("file", (p.name, f, ctype))]
+            return await self._post_multipart("/documents/upload", files=files, want_obj=want_obj, want_raw=want_raw)
 
-    async def insert_text(self, text: str, file_source: Optional[str] = None, want_obj: bool = False) -> Any:
-        payload = {"text": text}
-        if file_source is not None:
-            payload["file_source"] = file_source
-        return await self._post_json("/documents/text", payload, want_obj=want_obj)
+    async def upload_files(self, file_paths: List[str], concurrency: int = UPLOAD_CONCURRENCY) -> List[Any]:
+        """Upload files concurrently; a failed upload yields {"error": ...} instead of failing the batch."""
+        sem = asyncio.Semaphore(concurrency)
 
-    async def insert_texts(self, texts: List[str], file_sources: Optional[List[str]] = None, want_obj: bool = False) -> Any:
-        payload: Dict[str, Any] = {"texts": list(texts)}
-        if file_sources is not None:
-            payload["file_sources"] = list(file_sources)
-        return await self._post_json("/documents/texts", payload, want_obj=want_obj)
+        async def upload(p: str) -> Any:
+            async with sem:
+                return await self.upload_file(p, want_obj=True)
 
-    async def documents_clear(self, want_obj: bool = False) -> Any:
-        return await self._delete("/documents", want_obj=want_obj)
+        results = await asyncio.gather(*(upload(p) for p in file_paths), return_exceptions=True)
+        return [{"error": str(r)} if isinstance(r, Exception) else r for r in results]
 
-    async def documents_statuses(self, want_obj: bool = False) -> Any:
-        return await self._get("/documents", want_obj=want_obj)
-
-    async def pipeline_status(self, want_obj: bool = False) -> Any:
-        return await self._get("/documents/pipeline_status", want_obj=want_obj)
-
-    async def delete_document(self, doc_ids: List[str], delete_file: bool = False, want_obj: bool = False) -> Any:
-        payload = {"doc_ids": list(doc_ids), "delete_file": bool(delete_file)}
-        return await self._delete("/documents/delete_document", json_body=payload, want_obj=want_obj)
-
-    async def clear_cache(self, want_obj: bool = False) -> Any:
-        return await self._post_json("/documents/clear_cache", payload={}, want_obj=want_obj)
-
-    async def delete_entity(self, entity_name: str, want_obj: bool = False) -> Any:
+    async def insert_text(self, text: str, file_source: Optional[str] = None, want_obj: bool = False, want_raw: bool = False, batch: bool = False) -> Any:
+        if batch:
+            # Share one /documents/texts round-trip with other concurrent inserts
+            raw = await self._batcher.submit(text, file_source)
+            return self._from_raw(raw, want_obj, want_raw)
+        payload = {"text": text}
+        if file_source is not None:
+            payload["file_source"] = file_source
+        return await self._post_json("/documents/text", payload, want_obj=want_obj, want_raw=want_raw)
+
+    async def insert_texts(self, texts: List[str], file_sources: Optional[List[str]] = None, want_obj: bool = False, want_raw: bool = False,
+                           chunk_size: int = INSERT_CHUNK_SIZE, concurrency: int = INSERT_CONCURRENCY) -> Any:
+        # Chunks slice both lists by position, so they must line up before anything is sent
+        if file_sources is not None and len(file_sources) != len(texts):
+            raise ValueError(f"'file_sources' has {len(file_sources)} entries for {len(texts)} texts")
+        if len(texts) <= chunk_size:
+            payload: Dict[str, Any] = {"texts": texts}
+            if file_sources is not None:
+                payload["file_sources"] = file_sources
+            return await self._post_json("/documents/texts", payload, want_obj=want_obj, want_raw=want_raw)
+
+        # Split big batches into parallel requests; the result is a list with one response per chunk,
+        # and a failed chunk yields {"error": ...} so the track_ids of the chunks that went in are kept
+        sem = asyncio.Semaphore(concurrency)
+
+        async def send(start: int) -> bytes:
+            chunk: Dict[str, Any] = {"texts": texts[start:start + chunk_size]}
+            if file_sources is not None:
+                chunk["file_sources"] = file_sources[start:start + chunk_size]
+            async with sem:
+                return await self._post_json("/documents/texts", chunk, want_raw=True)
+
+        results = await asyncio.gather(*(send(i) for i in range(0, len(texts), chunk_size)), return_exceptions=True)
+        raws = [orjson.dumps({"error": str(r)}) if isinstance(r, Exception) else r for r in results]
+        return self._from_raw(b"[" + b",".join(raws) + b"]", want_obj, want_raw)
+
+    async def documents_clear(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._delete("/documents", want_obj=want_obj, want_raw=want_raw)
+
+    async def documents_statuses(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/documents", want_obj=want_obj, want_raw=want_raw, cache_ttl=CACHE_TTL)
+
+    async def pipeline_status(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/documents/pipeline_status", want_obj=want_obj, want_raw=want_raw, cache_ttl=CACHE_TTL)
+
+    async def delete_document(self, doc_ids: List[str], delete_file: bool = False, want_obj: bool = False, want_raw: bool = False) -> Any:
+        payload = {"doc_ids": doc_ids, "delete_file": delete_file}
+        return await self._delete("/documents/delete_document", json_body=payload, want_obj=want_obj, want_raw=want_raw)
+
+    async def clear_cache(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._post_json("/documents/clear_cache", payload={}, want_obj=want_obj, want_raw=want_raw)
+
+    async def delete_entity(self, entity_name: str, want_obj: bool = False, want_raw: bool = False) -> Any:
         payload = {"entity_name": entity_name}
-        return await self._delete("/documents/delete_entity", json_body=payload, want_obj=want_obj)
+        return await self._delete("/documents/delete_entity", json_body=payload, want_obj=want_obj, want_raw=want_raw)
 
-    async def delete_relation(self, source_entity: str, target_entity: str, want_obj: bool = False) -> Any:
+    async def delete_relation(self, source_entity: str, target_entity: str, want_obj: bool = False, want_raw: bool = False) -> Any:
         payload = {"source_entity": source_entity, "target_entity": target_entity}
-        return await self._delete("/documents/delete_relation", json_body=payload, want_obj=want_obj)
+        return await self._delete("/documents/delete_relation", json_body=payload, want_obj=want_obj, want_raw=want_raw)
 
-    async def track_status(self, track_id: str, want_obj: bool = False) -> Any:
-        return await self._get(f"/documents/track_status/{track_id}", want_obj=want_obj)
+    async def track_status(self, track_id: str, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get(f"/documents/track_status/{track_id}", want_obj=want_obj, want_raw=want_raw)
 
-    async def documents_paginated(self, request: Dict[str, Any], want_obj: bool = False) -> Any:
-        return await self._post_json("/documents/paginated", payload=request, want_obj=want_obj)
+    async def documents_paginated(self, request: Dict[str, Any], want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._post_json("/documents/paginated", payload=request, want_obj=want_obj, want_raw=want_raw)
 
-    async def status_counts(self, want_obj: bool = False) -> Any:
-        return await self._get("/documents/status_counts", want_obj=want_obj)
+    async def status_counts(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/documents/status_counts", want_obj=want_obj, want_raw=want_raw, cache_ttl=CACHE_TTL)
 
     # ---------------------- query -----------------------------------------
 
-    async def query(self, request: Dict[str, Any], want_obj: bool = True) -> Any:
+    async def query(self, request: Dict[str, Any], want_obj: bool = True, want_raw: bool = False, use_cache: bool = True) -> Any:
         # want_obj=True to return structured {response: ...}
-        return await self._post_json("/query", payload=request, want_obj=want_obj)
-
-    async def query_stream(self, request: Dict[str, Any], want_obj: bool = True) -> Any:
-        # Returns {raw_stream": "..."} when want_obj=True
-        return await self._post_json("/query/stream", payload=request, stream=True, want_obj=want_obj)
+        # Answers are cached only when LIGHTRAG_QUERY_CACHE_TTL is set: LightRAG ingests in the
+        # background and other clients write too, so a cached answer can be stale until it expires
+        ttl = env().query_cache_ttl
+        if not use_cache or ttl <= 0:
+            return await self._post_json("/query", payload=request, want_obj=want_obj, want_raw=want_raw)
+        # Questions that differ only in whitespace share a cache entry
+        key = orjson.dumps({**request, "query": " ".join(str(request.get("query", "")).split())}, option=orjson.OPT_SORT_KEYS)
+        hit = self._query_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            self._query_cache.move_to_end(key)
+            return self._from_raw(hit[1], want_obj, want_raw)
+        gen = self._cache_gen
+        raw = await self._post_json("/query", payload=request, want_raw=True)
+        if gen == self._cache_gen:
+            self._query_cache[key] = (time.monotonic(), raw)
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > CACHE_MAX_ENTRIES:
+                self._query_cache.popitem(last=False)
+        return self._from_raw(raw, want_obj, want_raw)
+
+    def query_stream(self, request: Dict[str, Any]) -> AsyncIterator[str]:
+        # Async iterator over the NDJSON lines of the streamed response
+        return self._post_json_stream("/query/stream", payload=request)
+
+    async def query_stream_text(self, request: Dict[str, Any]) -> str:
+        # Whole streamed body for callers that don't consume it line by line: one read, one decode.
+        # Lines are split and blank ones dropped exactly like _post_json_stream (httpx's aiter_lines
+        # uses str.splitlines), so both paths return the same text.
+        r = await self._send_post_json("/query/stream", payload=request)
+        return "\n".join(line for line in r.content.decode("utf-8", "replace").splitlines() if line)
 
     # ---------------------- graph -----------------------------------------
 
-    async def graph_labels(self, want_obj: bool = False) -> Any:
-        return await self._get("/graph/label/list", want_obj=want_obj)
+    async def graph_labels(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/graph/label/list", want_obj=want_obj, want_raw=want_raw, cache_ttl=CACHE_TTL)
 
-    async def graphs(self, label: str, max_depth: int = 3, max_nodes: int = 1000, want_obj: bool = False) -> Any:
-        params = {"label": label, "max_depth": int(max_depth), "max_nodes": int(max_nodes)}
-        return await self._get("/graphs", params=params, want_obj=want_obj)
+    async def graphs(self, label: str, max_depth: int = 3, max_nodes: int = 1000, want_obj: bool = False, want_raw: bool = False) -> Any:
+        params = {"label": label, "max_depth": max_depth, "max_nodes": max_nodes}
+        return await self._get("/graphs", params=params, want_obj=want_obj, want_raw=want_raw)
 
-    async def entity_exists(self, name: str, want_obj: bool = False) -> Any:
-        return await self._get("/graph/entity/exists", params={"name": name}, want_obj=want_obj)
+    async def entity_exists(self, name: str, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/graph/entity/exists", params={"name": name}, want_obj=want_obj, want_raw=want_raw, cache_ttl=CACHE_TTL)
 
-    async def update_entity(self, entity_name: str, updated_data: Dict[str, Any], allow_rename: bool = False, want_obj: bool = False) -> Any:
-        payload = {"entity_name": entity_name, "updated_data": updated_data, "allow_rename": bool(allow_rename)}
-        return await self._post_json("/graph/entity/edit", payload, want_obj=want_obj)
+    async def update_entity(self, entity_name: str, updated_data: Dict[str, Any], allow_rename: bool = False, want_obj: bool = False, want_raw: bool = False) -> Any:
+        payload = {"entity_name": entity_name, "updated_data": updated_data, "allow_rename": allow_rename}
+        return await self._post_json("/graph/entity/edit", payload, want_obj=want_obj, want_raw=want_raw)
 
-    async def update_relation(self, source_id: str, target_id: str, updated_data: Dict[str, Any], want_obj: bool = False) -> Any:
+    async def update_relation(self, source_id: str, target_id: str, updated_data: Dict[str, Any], want_obj: bool = False, want_raw: bool = False) -> Any:
         payload = {"source_id": source_id, "target_id": target_id, "updated_data": updated_data}
-        return await self._post_json("/graph/relation/edit", payload, want_obj=want_obj)
+        return await self._post_json("/graph/relation/edit", payload, want_obj=want_obj, want_raw=want_raw)
 
     # ---------------------- ollama-compatible ------------------------------
 
-    async def api_version(self, want_obj: bool = False) -> Any:
-        return await self._get("/api/version", want_obj=want_obj)
+    async def api_version(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/api/version", want_obj=want_obj, want_raw=want_raw, cache_ttl=STATIC_CACHE_TTL)
 
-    async def api_tags(self, want_obj: bool = False) -> Any:
-        return await self._get("/api/tags", want_obj=want_obj)
+    async def api_tags(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/api/tags", want_obj=want_obj, want_raw=want_raw, cache_ttl=STATIC_CACHE_TTL)
 
-    async def api_ps(self, want_obj: bool = False) -> Any:
-        return await self._get("/api/ps", want_obj=want_obj)
+    async def api_ps(self, want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._get("/api/ps", want_obj=want_obj, want_raw=want_raw, cache_ttl=CACHE_TTL)
 
-    async def api_generate(self, payload: Dict[str, Any], want_obj: bool = False) -> Any:
-        return await self._post_json("/api/generate", payload, want_obj=want_obj)
+    async def api_generate(self, payload: Dict[str, Any], want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._post_json("/api/generate", payload, want_obj=want_obj, want_raw=want_raw)
 
-    async def api_chat(self, payload: Dict[str, Any], want_obj: bool = False) -> Any:
-        return await self._post_json("/api/chat", payload, want_obj=want_obj)
+    async def api_chat(self, payload: Dict[str, Any], want_obj: bool = False, want_raw: bool = False) -> Any:
+        return await self._post_json("/api/chat", payload, want_obj=want_obj, want_raw=want_raw)
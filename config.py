@@ -1,6 +1,8 @@
 import os
 import argparse
+import functools
 import logging
+from types import SimpleNamespace
 from typing import Optional, List
 import yaml
 
@@ -19,6 +21,12 @@ DEFAULT_TOOLS = [
     "graphs_get",
 ]
 
+# Large documents_insert_texts batches are split into requests of this many texts,
+# at most INSERT_CONCURRENCY of them in flight (defaults for client and tool arguments)
+INSERT_CHUNK_SIZE = 128
+INSERT_CONCURRENCY = 4
+
+@functools.lru_cache(maxsize=1)
 def _load_tools_from_yaml(config_path: str) -> Optional[List[str]]:
     """Load the list of enabled tools from a YAML config file."""
     if not os.path.exists(config_path):
@@ -39,57 +47,80 @@ def _load_tools_from_yaml(config_path: str) -> Optional[List[str]]:
         logger.error(f"Error parsing YAML file {config_path}: {e}")
     return None
 
+# Built once at import; env-derived defaults are applied after parsing because
+# the .env file may only be loaded after this module is imported.
+_parser = argparse.ArgumentParser(description="LightRAG MCP server")
+_parser.add_argument(
+    "--service-url",
+    type=str,
+    default=None,
+    help="LightRAG HTTP base URL (default: env LIGHTRAG_BASE_URL or http://localhost:9621)",
+)
+_parser.add_argument(
+    "--key",
+    type=str,
+    default=None,
+    help="LightRAG API key if enabled (default: env LIGHTRAG_API_KEY)",
+)
+_parser.add_argument(
+    "--tools",
+    type=str,
+    default=None,
+    help=f"Comma-separated tools to enable (default: from config.yaml or built-in list)",
+)
+
+@functools.lru_cache(maxsize=1)
+def env() -> SimpleNamespace:
+    """Snapshot of the LIGHTRAG_* environment, taken on first use.
+    Not taken at import because .env is loaded after this module is imported;
+    changes to the environment after the first call are not seen.
+    """
+    return SimpleNamespace(
+        base_url=os.getenv("LIGHTRAG_BASE_URL"),
+        api_key=os.getenv("LIGHTRAG_API_KEY"),
+        tools=os.getenv("LIGHTRAG_TOOLS"),
+        pretty=os.getenv("LIGHTRAG_MCP_PRETTY") == "1",
+        query_cache_ttl=float(os.getenv("LIGHTRAG_QUERY_CACHE_TTL") or 0),
+    )
+
+@functools.lru_cache(maxsize=1)
 def resolve_config() -> tuple[str, Optional[str], List[str]]:
     """Resolve LightRAG config from CLI/env/.env/YAML.
     Order of precedence: CLI > environment > YAML > defaults.
+    The result is cached for the lifetime of the process.
     Returns:
         - base_url (str): e.g. http://localhost:9621
         - api_key (str|None): optional API key
         - enabled_tools (list[str]): tool names to expose
     """
+    args, _ = _parser.parse_known_args()
+
     # env (already loaded from .env if present)
-    env_base = os.getenv("LIGHTRAG_BASE_URL")
-    env_key = os.getenv("LIGHTRAG_API_KEY")
-    env_tools = os.getenv("LIGHTRAG_TOOLS")
+    e = env()
+    env_base, env_key, env_tools = e.base_url, e.api_key, e.tools
 
-    # Load from config.yaml, making path relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    config_path = os.path.join(script_dir, 'config.yaml')
-    yaml_tools = _load_tools_from_yaml(config_path)
+    service_url = args.service_url if args.service_url is not None else env_base
+    key = args.key if args.key is not None else env_key
 
-    # Determine the source for tools
-    if yaml_tools is not None:
-        tools_source = ",".join(yaml_tools)
-    elif env_tools:
-        tools_source = env_tools
+    # Determine the source for tools; config.yaml is only read when --tools is absent
+    if args.tools is not None:
+        tools_source = args.tools
     else:
-        tools_source = ",".join(DEFAULT_TOOLS)
-
-    parser = argparse.ArgumentParser(description="LightRAG MCP server")
-    parser.add_argument(
-        "--service-url",
-        type=str,
-        default=env_base or "http://localhost:9621",
-        help="LightRAG HTTP base URL (default: env LIGHTRAG_BASE_URL or http://localhost:9621)",
-    )
-    parser.add_argument(
-        "--key",
-        type=str,
-        default=env_key,
-        help="LightRAG API key if enabled (default: env LIGHTRAG_API_KEY)",
-    )
-    parser.add_argument(
-        "--tools",
-        type=str,
-        default=tools_source,
-        help=f"Comma-separated tools to enable (default: from config.yaml or built-in list)",
-    )
+        # Load from config.yaml, making path relative to this script
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        config_path = os.path.join(script_dir, 'config.yaml')
+        yaml_tools = _load_tools_from_yaml(config_path)
+        if yaml_tools is not None:
+            tools_source = ",".join(yaml_tools)
+        elif env_tools:
+            tools_source = env_tools
+        else:
+            tools_source = ",".join(DEFAULT_TOOLS)
 
-    args, _ = parser.parse_known_args()
-    base = (args.service_url or "http://localhost:9621").rstrip("/")
-    key = args.key or None
+    base = (service_url or "http://localhost:9621").rstrip("/")
+    key = key or None
     
     # Split tool string into a list of names
-    enabled_tools = [t.strip() for t in (args.tools or "").split(",") if t.strip()]
+    enabled_tools = [t.strip() for t in (tools_source or "").split(",") if t.strip()]
     
-    return base, key, enabled_tools
\ No newline at end of file
+    return base, key, enabled_tools
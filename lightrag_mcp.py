@@ -18,33 +18,38 @@ HTTP API and exposes tools for **all endpoints** in your OpenAPI spec
 Environment variables (optional):
   LIGHTRAG_BASE_URL   → e.g. http://localhost:9621
   LIGHTRAG_API_KEY    → if you started the server with --key
+  LIGHTRAG_MCP_PRETTY → 1 to indent JSON tool output (compact by default)
+  LIGHTRAG_DISABLE_DOTENV → 1 to skip looking for a .env file
+  LIGHTRAG_QUERY_CACHE_TTL → seconds to reuse identical query answers (default 0, off)
 
 CLI flags (override env):
   --service-url URL   → base URL of LightRAG API (default from env or localhost)
   --key KEY           → API key if the server requires it (default from env)
 
 Quick start:
-  pip install mcp httpx pydantic python-dotenv
+  pip install mcp "httpx[http2]" msgspec python-dotenv orjson
   python lightrag_mcp.py --service-url http://localhost:9621
 
 Test queries (from an MCP client):
   {"tool":"query","arguments":{"query":"What did we ingest?","mode":"hybrid","top_k":5}}
 
-Note: streaming (/query/stream) is concatenated into one response string for MCP.
+Note: streaming (/query/stream) is concatenated into one response string for MCP;
+clients that send a progressToken also receive each line as a progress notification.
 """
 
 import asyncio
-import json
+import contextlib
 import logging
+import os
 import sys
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable
 
 import httpx
-from dotenv import load_dotenv, find_dotenv
+import orjson
 
-from client import LightRagHttpClient
-from config import resolve_config
-from models import QueryRequest
+from client import LightRagHttpClient, dumps_text
+from config import env, resolve_config
+from models import DeleteDocumentsArgs, GraphArgs, InsertTextsArgs, parse_args, parse_query_request
 from tools import list_tools
 
 # Optional JSON content support (newer MCP runtimes). Fallback to text-only.
@@ -55,12 +60,17 @@ try:
 except ImportError as e:
     print("Missing dependency:", e)
     sys.exit(1)
+try:
+    from mcp.types import JsonContent  # type: ignore[attr-defined]
+except ImportError:
+    JsonContent = None
 
-# .env support
-_DOTENV_LOADED = load_dotenv(find_dotenv())
-
-# Global variable to store the enabled tools
-enabled_tools = []
+# .env support; LIGHTRAG_DISABLE_DOTENV=1 skips the filesystem search when env is set externally
+if os.getenv("LIGHTRAG_DISABLE_DOTENV") != "1":
+    from dotenv import load_dotenv, find_dotenv
+    _DOTENV_LOADED = load_dotenv(find_dotenv())
+else:
+    _DOTENV_LOADED = False
 
 # --------------------------- logging ---------------------------------------
 logging.basicConfig(
@@ -71,18 +81,322 @@ logger = logging.getLogger("LightRAG-MCP")
 # if _DOTENV_LOADED:
 #     logger.info("Loaded environment from .env")
 
+# Enabled tools are resolved once, after .env is loaded and logging is configured so
+# config messages (e.g. "Loaded tools from config.yaml") are shown (CLI > env > config.yaml > defaults)
+_, _, enabled_tools = resolve_config()
+
 
 # --------------------------- helpers ---------------------------------------
 
-def _as_json_content(obj: Any) -> TextContent:
-    """Return JSON content if supported by MCP; otherwise pretty JSON text."""
-    JsonContent = globals().get('JsonContent')
-    if JsonContent is not None:
-        try:
-            return JsonContent(type="json", json=obj)
-        except Exception:
-            pass
-    return TextContent(type="text", text=json.dumps(obj, indent=2, ensure_ascii=False))
+# Tool output is always built from a str, so TextContent is constructed without
+# re-running pydantic validation on every response.
+def _as_text_json_content(obj: Any) -> TextContent:
+    return TextContent.model_construct(type="text", text=dumps_text(obj))
+
+
+def _as_native_json_content(obj: Any) -> TextContent:
+    try:
+        return JsonContent(type="json", json=obj)
+    except Exception:
+        return _as_text_json_content(obj)
+
+
+# Return JSON content if supported by MCP; otherwise JSON text. Chosen once at import.
+_as_json_content: Callable[[Any], TextContent] = (
+    _as_native_json_content if JsonContent is not None else _as_text_json_content
+)
+
+
+def _as_raw_json_content(raw: bytes, **fields: Any) -> TextContent:
+    """Embed an upstream JSON body as "result" next to `fields` without re-parsing it."""
+    return _splice_raw_json(fields, {"result": raw})
+
+
+def _splice_raw_json(fields: dict, raws: dict[str, bytes]) -> TextContent:
+    """JSON object of `fields` followed by the upstream bodies in `raws`, spliced in as bytes."""
+    if env().pretty:
+        # Indenting needs the parsed bodies; LIGHTRAG_MCP_PRETTY is a debugging aid, not the fast path
+        return _as_text_json_content({**fields, **{k: orjson.loads(v) for k, v in raws.items()}})
+    out = bytearray(orjson.dumps(fields)[:-1])
+    for k, v in raws.items():
+        if len(out) > 1:
+            out += b","
+        out += orjson.dumps(k) + b":" + v
+    out += b"}"
+    return TextContent.model_construct(type="text", text=out.decode())
+
+
+# --------------------------- tool handlers ---------------------------------
+
+# -------- system & auth --------
+
+async def _tool_health(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.health(want_raw=True))]
+
+
+async def _tool_auth_status(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.auth_status(want_raw=True))]
+
+
+async def _tool_auth_login(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    scope = arguments.get("scope", "")
+    payload = await client.login(arguments["username"], arguments["password"], scope, want_obj=True)
+    return [_as_json_content({"result": payload})]
+
+
+# -------- documents --------
+
+async def _tool_documents_scan(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.documents_scan(want_raw=True))]
+
+
+async def _tool_documents_upload_file(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    fp = arguments["file_path"]
+    return [_as_raw_json_content(await client.upload_file(fp, want_raw=True), file=fp)]
+
+
+async def _tool_documents_upload_files(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_json_content({"results": await client.upload_files(arguments["file_paths"])})]
+
+
+async def _tool_documents_insert_text(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    file_source = arguments.get("file_source")
+    return [_as_raw_json_content(await client.insert_text(arguments["text"], file_source, want_raw=True, batch=True))]
+
+
+async def _tool_documents_insert_texts(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    args = parse_args(arguments, InsertTextsArgs)
+    return [_as_raw_json_content(await client.insert_texts(args.texts, args.file_sources, want_raw=True,
+                                                           chunk_size=args.chunk_size, concurrency=args.concurrency))]
+
+
+async def _tool_documents_clear_all(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.documents_clear(want_raw=True))]
+
+
+async def _tool_documents_list_statuses(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.documents_statuses(want_raw=True))]
+
+
+async def _tool_documents_pipeline_status(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.pipeline_status(want_raw=True))]
+
+
+async def _tool_documents_delete_by_ids(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    args = parse_args(arguments, DeleteDocumentsArgs)
+    return [_as_raw_json_content(await client.delete_document(args.doc_ids, args.delete_file, want_raw=True))]
+
+
+async def _tool_documents_clear_cache(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.clear_cache(want_raw=True))]
+
+
+async def _tool_documents_delete_entity(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.delete_entity(arguments["entity_name"], want_raw=True))]
+
+
+async def _tool_documents_delete_relation(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    se, te = arguments["source_entity"], arguments["target_entity"]
+    return [_as_raw_json_content(await client.delete_relation(se, te, want_raw=True))]
+
+
+async def _tool_documents_track_status(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    track_id = arguments["track_id"]
+    return [_as_raw_json_content(await client.track_status(track_id, want_raw=True), track_id=track_id)]
+
+
+async def _tool_documents_paginated(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    # Neither the client nor the output mutates the request, so no copy is needed
+    return [_as_raw_json_content(await client.documents_paginated(arguments, want_raw=True), request=arguments)]
+
+
+async def _tool_documents_status_counts(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.status_counts(want_raw=True))]
+
+
+# -------- query (structured outputs) --------
+
+async def _tool_query(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    req = parse_query_request(arguments)
+    qres = await client.query(req, want_obj=True)
+    # Expected schema: {"response": "..."}
+    if isinstance(qres, dict) and isinstance(qres.get("response"), str):
+        response_text = qres["response"]
+    else:
+        response_text = str(qres)
+    return [TextContent.model_construct(type="text", text=response_text)]
+
+
+async def _tool_query_stream(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    req = parse_query_request(arguments)
+    # Forward each line as a progress notification when the caller asked for progress;
+    # the full stream is still returned as the tool result.
+    ctx = app.request_context
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+    if progress_token is None:
+        stream_text = await client.query_stream_text(req)
+    else:
+        lines = []
+        async for line in client.query_stream(req):
+            lines.append(line)
+            await ctx.session.send_progress_notification(progress_token, len(lines), message=line)
+        stream_text = "\n".join(lines)
+    out = {"request": req, "stream": stream_text}
+    return [_as_json_content(out)]
+
+
+# -------- graph --------
+
+async def _tool_graph_labels(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.graph_labels(want_raw=True))]
+
+
+async def _tool_graphs_get(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    args = parse_args(arguments, GraphArgs)
+    return [_as_raw_json_content(await client.graphs(args.label, args.max_depth, args.max_nodes, want_raw=True), label=args.label)]
+
+
+async def _tool_graph_entity_exists(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    name_ = arguments["name"]
+    return [_as_raw_json_content(await client.entity_exists(name_, want_raw=True), name=name_)]
+
+
+async def _tool_graph_update_entity(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    en, data = arguments["entity_name"], arguments["updated_data"]
+    allow = bool(arguments.get("allow_rename", False))
+    return [_as_raw_json_content(await client.update_entity(en, data, allow, want_raw=True))]
+
+
+async def _tool_graph_update_relation(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    sid, tid, data = arguments["source_id"], arguments["target_id"], arguments["updated_data"]
+    return [_as_raw_json_content(await client.update_relation(sid, tid, data, want_raw=True))]
+
+
+async def _tool_graph_panel(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    args = parse_args(arguments, GraphArgs)
+    label, md, mn = args.label, args.max_depth, args.max_nodes
+    name_ = arguments.get("name") or label
+    # The three lookups are independent, so overlap their round-trips
+    try:
+        async with asyncio.TaskGroup() as tg:
+            labels = tg.create_task(client.graph_labels(want_raw=True))
+            graph = tg.create_task(client.graphs(label, md, mn, want_raw=True))
+            exists = tg.create_task(client.entity_exists(name_, want_raw=True))
+    except ExceptionGroup as eg:
+        # Surface the first failure so call_tool reports it like any other tool error
+        raise eg.exceptions[0]
+    # The graph can hold up to max_nodes nodes, so the upstream bodies are spliced in unparsed
+    return [_splice_raw_json({"label": label, "name": name_}, {
+        "labels": labels.result(),
+        "graph": graph.result(),
+        "entity_exists": exists.result(),
+    })]
+
+
+# -------- ollama-compatible --------
+
+async def _tool_ollama_version(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.api_version(want_raw=True))]
+
+
+async def _tool_ollama_tags(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.api_tags(want_raw=True))]
+
+
+async def _tool_ollama_ps(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    return [_as_raw_json_content(await client.api_ps(want_raw=True))]
+
+
+async def _tool_ollama_generate(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    payload = arguments["payload"]
+    return [_as_raw_json_content(await client.api_generate(payload, want_raw=True), request=payload)]
+
+
+async def _tool_ollama_chat(client: LightRagHttpClient, arguments: dict) -> list[TextContent]:
+    payload = arguments["payload"]
+    return [_as_raw_json_content(await client.api_chat(payload, want_raw=True), request=payload)]
+
+
+_HANDLERS: dict[str, Callable[[LightRagHttpClient, dict], Awaitable[list[TextContent]]]] = {
+    "health": _tool_health,
+    "auth_status": _tool_auth_status,
+    "auth_login": _tool_auth_login,
+    "documents_scan": _tool_documents_scan,
+    "documents_upload_file": _tool_documents_upload_file,
+    "documents_upload_files": _tool_documents_upload_files,
+    "documents_insert_text": _tool_documents_insert_text,
+    "documents_insert_texts": _tool_documents_insert_texts,
+    "documents_clear_all": _tool_documents_clear_all,
+    "documents_list_statuses": _tool_documents_list_statuses,
+    "documents_pipeline_status": _tool_documents_pipeline_status,
+    "documents_delete_by_ids": _tool_documents_delete_by_ids,
+    "documents_clear_cache": _tool_documents_clear_cache,
+    "documents_delete_entity": _tool_documents_delete_entity,
+    "documents_delete_relation": _tool_documents_delete_relation,
+    "documents_track_status": _tool_documents_track_status,
+    "documents_paginated": _tool_documents_paginated,
+    "documents_status_counts": _tool_documents_status_counts,
+    "query": _tool_query,
+    "query_stream": _tool_query_stream,
+    "graph_labels": _tool_graph_labels,
+    "graphs_get": _tool_graphs_get,
+    "graph_entity_exists": _tool_graph_entity_exists,
+    "graph_update_entity": _tool_graph_update_entity,
+    "graph_update_relation": _tool_graph_update_relation,
+    "graph_panel": _tool_graph_panel,
+    "ollama_version": _tool_ollama_version,
+    "ollama_tags": _tool_ollama_tags,
+    "ollama_ps": _tool_ollama_ps,
+    "ollama_generate": _tool_ollama_generate,
+    "ollama_chat": _tool_ollama_chat,
+}
+
+def _is_non_empty_list(v: Any) -> bool:
+    return isinstance(v, list) and bool(v)
+
+
+def _is_object(v: Any) -> bool:
+    return isinstance(v, dict)
+
+
+def _is_set(v: Any) -> bool:
+    return v is not None
+
+
+# Required arguments checked by call_tool before dispatch, so handlers can index them directly:
+# tool -> ((argument, check), ...), error message. Scalars only need to be truthy, as before the
+# table existed (upstream accepts e.g. a numeric track_id or name). Tools that validate through
+# models.parse_args are not listed.
+_REQUIRED: dict[str, tuple[tuple[tuple[str, Callable[[Any], bool]], ...], str]] = {
+    "auth_login": ((("username", bool), ("password", bool)), "'username' and 'password' are required"),
+    "documents_upload_file": ((("file_path", bool),), "'file_path' is required"),
+    "documents_upload_files": ((("file_paths", _is_non_empty_list),), "'file_paths' must be a non-empty list"),
+    "documents_insert_text": ((("text", bool),), "'text' is required"),
+    "documents_delete_entity": ((("entity_name", bool),), "'entity_name' is required"),
+    "documents_delete_relation": ((("source_entity", bool), ("target_entity", bool)),
+                                  "'source_entity' and 'target_entity' are required"),
+    "documents_track_status": ((("track_id", bool),), "'track_id' is required"),
+    "graph_entity_exists": ((("name", bool),), "'name' is required"),
+    "graph_update_entity": ((("entity_name", bool), ("updated_data", _is_set)),
+                            "'entity_name' and 'updated_data' are required"),
+    "graph_update_relation": ((("source_id", bool), ("target_id", bool), ("updated_data", _is_set)),
+                              "'source_id', 'target_id', 'updated_data' are required"),
+    "ollama_generate": ((("payload", _is_object),), "'payload' (object) is required"),
+    "ollama_chat": ((("payload", _is_object),), "'payload' (object) is required"),
+}
+
+
+def _check_required(name: str, arguments: dict) -> None:
+    spec = _REQUIRED.get(name)
+    if spec is not None:
+        checks, message = spec
+        if not all(check(arguments.get(key)) for key, check in checks):
+            raise ValueError(message)
+
+
+# Precomputed for tools/list; disabled tools are dropped from dispatch so they can't be called
+_ENABLED_TOOLS = list_tools(enabled_tools)
+_HANDLERS = {t.name: _HANDLERS[t.name] for t in _ENABLED_TOOLS}
 
 
 # --------------------------- MCP server ------------------------------------
@@ -99,175 +413,31 @@ async def read_resource(uri: AnyUrl) -> str:
 @app.list_tools()
 async def list_tools_mcp() -> list[Tool]:
     """The list of tools is determined by the config resolution logic."""
-    return list_tools(enabled_tools)
+    return _ENABLED_TOOLS
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Call the tool if it's in the enabled list."""
-    if name not in enabled_tools:
-        return [TextContent(type="text", text=f"Error: Tool '{name}' is not enabled.")]
+def make_call_tool(client: LightRagHttpClient) -> Callable[[str, dict], Awaitable[list[TextContent]]]:
+    """Build the call_tool handler around the process-wide client so connections are pooled across calls."""
 
-    client = LightRagHttpClient()
-    try:
-        # -------- system & auth --------
-        if name == "health":
-            return [_as_json_content({"result": await client.health(want_obj=True)})]
-        if name == "auth_status":
-            return [_as_json_content({"result": await client.auth_status(want_obj=True)})]
-        if name == "auth_login":
-            username = arguments.get("username")
-            password = arguments.get("password")
-            scope = arguments.get("scope", "")
-            if not username or not password:
-                raise ValueError("'username' and 'password' are required")
-            payload = await client.login(username, password, scope, want_obj=True)
-            return [_as_json_content({"result": payload})]
-
-        # -------- documents --------
-        if name == "documents_scan":
-            return [_as_json_content({"result": await client.documents_scan(want_obj=True)})]
-        if name == "documents_upload_file":
-            fp = arguments.get("file_path")
-            if not fp:
-                raise ValueError("'file_path' is required")
-            return [_as_json_content({"file": fp, "result": await client.upload_file(fp, want_obj=True)})]
-        if name == "documents_upload_files":
-            fps = arguments.get("file_paths")
-            if not fps or not isinstance(fps, list):
-                raise ValueError("'file_paths' must be a non-empty list")
-            tasks = [asyncio.create_task(client.upload_file(p, want_obj=True)) for p in fps]
-            results = await asyncio.gather(*tasks)
-            return [_as_json_content({"results": results})]
-        if name == "documents_insert_text":
-            text = arguments.get("text")
-            if not text:
-                raise ValueError("'text' is required")
-            file_source = arguments.get("file_source")
-            return [_as_json_content({"result": await client.insert_text(text, file_source, want_obj=True)})]
-        if name == "documents_insert_texts":
-            texts = arguments.get("texts")
-            if not texts or not isinstance(texts, list):
-                raise ValueError("'texts' must be a non-empty list of strings")
-            file_sources = arguments.get("file_sources")
-            return [_as_json_content({"result": await client.insert_texts(texts, file_sources, want_obj=True)})]
-        if name == "documents_clear_all":
-            return [_as_json_content({"result": await client.documents_clear(want_obj=True)})]
-        if name == "documents_list_statuses":
-            return [_as_json_content({"result": await client.documents_statuses(want_obj=True)})]
-        if name == "documents_pipeline_status":
-            return [_as_json_content({"result": await client.pipeline_status(want_obj=True)})]
-        if name == "documents_delete_by_ids":
-            doc_ids = arguments.get("doc_ids")
-            if not doc_ids or not isinstance(doc_ids, list):
-                raise ValueError("'doc_ids' must be a non-empty list of strings")
-            delete_file = bool(arguments.get("delete_file", False))
-            return [_as_json_content({"result": await client.delete_document(doc_ids, delete_file, want_obj=True)})]
-        if name == "documents_clear_cache":
-            return [_as_json_content({"result": await client.clear_cache(want_obj=True)})]
-        if name == "documents_delete_entity":
-            en = arguments.get("entity_name")
-            if not en:
-                raise ValueError("'entity_name' is required")
-            return [_as_json_content({"result": await client.delete_entity(en, want_obj=True)})]
-        if name == "documents_delete_relation":
-            se = arguments.get("source_entity")
-            te = arguments.get("target_entity")
-            if not se or not te:
-                raise ValueError("'source_entity' and 'target_entity' are required")
-            return [_as_json_content({"result": await client.delete_relation(se, te, want_obj=True)})]
-        if name == "documents_track_status":
-            track_id = arguments.get("track_id")
-            if not track_id:
-                raise ValueError("'track_id' is required")
-            return [_as_json_content({"track_id": track_id, "result": await client.track_status(track_id, want_obj=True)})]
-        if name == "documents_paginated":
-            req = {k: v for k, v in arguments.items()}
-            return [_as_json_content({"request": req, "result": await client.documents_paginated(req, want_obj=True)})]
-        if name == "documents_status_counts":
-            return [_as_json_content({"result": await client.status_counts(want_obj=True)})]
-
-        # -------- query (structured outputs) --------
-        if name == "query":
-            try:
-                req = QueryRequest(**arguments).model_dump(exclude_unset=True)
-            except Exception as e:
-                raise ValueError(f"Invalid query arguments: {e}")
-            qres = await client.query(req, want_obj=True)
-            # Expected schema: {"response": "..."}
-            if isinstance(qres, dict) and "response" in qres:
-                response_text = qres["response"]
-            else:
-                response_text = str(qres)
-            return [TextContent(type="text", text=response_text)]
-
-        if name == "query_stream":
-            try:
-                req = QueryRequest(**arguments).model_dump(exclude_unset=True)
-            except Exception as e:
-                raise ValueError(f"Invalid query arguments: {e}")
-            sres = await client.query_stream(req, want_obj=True)
-            # sres is {"raw_stream": "..."}
-            stream_text = sres.get("raw_stream") if isinstance(sres, dict) else str(sres)
-            out = {"request": req, "stream": stream_text}
-            return [_as_json_content(out)]
-
-        # -------- graph --------
-        if name == "graph_labels":
-            return [_as_json_content({"result": await client.graph_labels(want_obj=True)})]
-        if name == "graphs_get":
-            label = arguments.get("label")
-            if not label:
-                raise ValueError("'label' is required")
-            md = int(arguments.get("max_depth", 3))
-            mn = int(arguments.get("max_nodes", 1000))
-            return [_as_json_content({"label": label, "result": await client.graphs(label, md, mn, want_obj=True)})]
-        if name == "graph_entity_exists":
-            name_ = arguments.get("name")
-            if not name_:
-                raise ValueError("'name' is required")
-            return [_as_json_content({"name": name_, "result": await client.entity_exists(name_, want_obj=True)})]
-        if name == "graph_update_entity":
-            en = arguments.get("entity_name")
-            data = arguments.get("updated_data")
-            allow = bool(arguments.get("allow_rename", False))
-            if not en or data is None:
-                raise ValueError("'entity_name' and 'updated_data' are required")
-            return [_as_json_content({"result": await client.update_entity(en, data, allow, want_obj=True)})]
-        if name == "graph_update_relation":
-            sid = arguments.get("source_id")
-            tid = arguments.get("target_id")
-            data = arguments.get("updated_data")
-            if not sid or not tid or data is None:
-                raise ValueError("'source_id', 'target_id', 'updated_data' are required")
-            return [_as_json_content({"result": await client.update_relation(sid, tid, data, want_obj=True)})]
-
-        # -------- ollama-compatible --------
-        if name == "ollama_version":
-            return [_as_json_content({"result": await client.api_version(want_obj=True)})]
-        if name == "ollama_tags":
-            return [_as_json_content({"result": await client.api_tags(want_obj=True)})]
-        if name == "ollama_ps":
-            return [_as_json_content({"result": await client.api_ps(want_obj=True)})]
-        if name == "ollama_generate":
-            payload = arguments.get("payload")
-            if not isinstance(payload, dict):
-                raise ValueError("'payload' (object) is required")
-            return [_as_json_content({"request": payload, "result": await client.api_generate(payload, want_obj=True)})]
-        if name == "ollama_chat":
-            payload = arguments.get("payload")
-            if not isinstance(payload, dict):
-                raise ValueError("'payload' (object) is required")
-            return [_as_json_content({"request": payload, "result": await client.api_chat(payload, want_obj=True)})]
-
-        raise ValueError(f"Unknown tool: {name}")
-
-    except httpx.HTTPStatusError as e:
-        logger.error("HTTP error in tool '%s': %s", name, e, exc_info=True)
-        return [TextContent(type="text", text=f"HTTP error: {e.response.status_code} {e.response.reason_phrase}")]
-    except Exception as e:
-        logger.error("Tool '%s' failed: %s", name, e, exc_info=True)
-        return [TextContent(type="text", text=f"Error: {e}")]
+    async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+        """Call the tool if it's in the enabled list."""
+        handler = _HANDLERS.get(name)
+        if handler is None:
+            return [TextContent.model_construct(type="text", text=f"Error: Tool '{name}' is not enabled.")]
+
+        # Tracebacks are only captured at DEBUG; at INFO a failing tool logs one line
+        try:
+            _check_required(name, arguments)
+            return await handler(client, arguments)
+
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error in tool '%s': %s", name, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return [TextContent.model_construct(type="text", text=f"HTTP error: {e.response.status_code} {e.response.reason_phrase}")]
+        except Exception as e:
+            logger.error("Tool '%s' failed: %s", name, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return [TextContent.model_construct(type="text", text=f"Error: {e}")]
+
+    return call_tool
 
 
 # --------------------------- entrypoint ------------------------------------
@@ -275,13 +445,15 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 async def main():
     from mcp.server.stdio import stdio_server
 
-    global enabled_tools
-    _, _, enabled_tools = resolve_config()
     # logger.info("Starting LightRAG MCP server …")
     # logger.info("Base URL: %s", base)
     # logger.info("API Key: %s", "<set>" if key else "<none>")
     # logger.info("Enabled tools: %s", ", ".join(enabled_tools))
 
+    client = LightRagHttpClient()
+    app.call_tool()(make_call_tool(client))
+    # Connect to LightRAG while the MCP handshake is still in progress
+    warm_up = asyncio.create_task(client.warm_up())
     try:
         async with stdio_server() as (read_stream, write_stream):
             await app.run(
@@ -290,8 +462,17 @@ async def main():
                 app.create_initialization_options(),
             )
     finally:
-        pass
+        warm_up.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await warm_up
+        await client.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop is a faster drop-in event loop; it is POSIX-only, so fall back to asyncio elsewhere.
+    # uvloop.run only exists from uvloop 0.18, so an older install also falls back.
+    try:
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+    run(main())
\ No newline at end of file
@@ -1,19 +1,65 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import Annotated, List, Literal, Optional, Dict, Any, TypeVar
 
-class QueryRequest(BaseModel):
+import msgspec
+
+from config import INSERT_CHUNK_SIZE, INSERT_CONCURRENCY
+
+T = TypeVar("T")
+
+PositiveInt = Annotated[int, msgspec.Meta(ge=1)]
+NonNegativeInt = Annotated[int, msgspec.Meta(ge=0)]
+NonEmptyStrList = Annotated[List[str], msgspec.Meta(min_length=1)]
+
+class QueryRequest(msgspec.Struct, omit_defaults=True):
     query: str
-    mode: str = Field("mix", enum=["local", "global", "hybrid", "naive", "mix", "bypass"])
+    mode: Literal["local", "global", "hybrid", "naive", "mix", "bypass"] = "mix"
     only_need_context: Optional[bool] = None
     only_need_prompt: Optional[bool] = None
     response_type: Optional[str] = None
-    top_k: Optional[int] = Field(None, ge=1)
-    chunk_top_k: Optional[int] = Field(None, ge=1)
-    max_entity_tokens: Optional[int] = Field(None, ge=1)
-    max_relation_tokens: Optional[int] = Field(None, ge=1)
-    max_total_tokens: Optional[int] = Field(None, ge=1)
+    top_k: Optional[PositiveInt] = None
+    chunk_top_k: Optional[PositiveInt] = None
+    max_entity_tokens: Optional[PositiveInt] = None
+    max_relation_tokens: Optional[PositiveInt] = None
+    max_total_tokens: Optional[PositiveInt] = None
     conversation_history: Optional[List[Dict[str, Any]]] = None
-    history_turns: Optional[int] = Field(None, ge=0)
+    history_turns: Optional[NonNegativeInt] = None
     ids: Optional[List[str]] = None
     user_prompt: Optional[str] = None
     enable_rerank: Optional[bool] = None
+
+# Tool arguments validated at the MCP boundary so the client receives canonical types
+
+class InsertTextsArgs(msgspec.Struct):
+    texts: NonEmptyStrList
+    file_sources: Optional[List[str]] = None
+    chunk_size: PositiveInt = INSERT_CHUNK_SIZE
+    concurrency: PositiveInt = INSERT_CONCURRENCY
+
+    def __post_init__(self):
+        if self.file_sources is not None and len(self.file_sources) != len(self.texts):
+            raise ValueError("'file_sources' must have one entry per text")
+
+class DeleteDocumentsArgs(msgspec.Struct):
+    doc_ids: NonEmptyStrList
+    delete_file: bool = False
+
+class GraphArgs(msgspec.Struct):
+    label: Annotated[str, msgspec.Meta(min_length=1)]
+    max_depth: PositiveInt = 3
+    max_nodes: PositiveInt = 1000
+
+def parse_args(arguments: dict, type_: type[T]) -> T:
+    """Validate tool arguments against a Struct; lax mode accepts e.g. "3" for an int."""
+    try:
+        return msgspec.convert(arguments, type_, strict=False)
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Invalid arguments: {e}")
+
+def parse_query_request(arguments: dict) -> Dict[str, Any]:
+    """Validate query tool arguments and return the request body for LightRAG."""
+    return msgspec.to_builtins(parse_args(arguments, QueryRequest))
+
+def query_request_schema() -> Dict[str, Any]:
+    """JSON schema of QueryRequest, inlined so it can be used as a tool inputSchema."""
+    _, components = msgspec.json.schema_components([QueryRequest])
+    return components["QueryRequest"]
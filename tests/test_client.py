@@ -0,0 +1,213 @@
+import asyncio
+import unittest
+
+import httpx
+import orjson
+
+from client import LightRagHttpClient
+
+
+class SendGetTest(unittest.IsolatedAsyncioTestCase):
+    """Concurrent identical GETs share one request (see LightRagHttpClient._send_get)."""
+
+    async def asyncSetUp(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.calls += 1
+            await self.release.wait()
+            return httpx.Response(200, json={"status": "healthy"})
+
+        self.client = LightRagHttpClient(base_url="http://lightrag", api_key="")
+        await self.client.client.aclose()
+        self.client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_concurrent_calls_share_one_request(self):
+        t1 = asyncio.create_task(self.client.health(want_obj=True))
+        t2 = asyncio.create_task(self.client.health(want_obj=True))
+        await asyncio.sleep(0)
+        self.release.set()
+        self.assertEqual(await t1, {"status": "healthy"})
+        self.assertEqual(await t2, {"status": "healthy"})
+        self.assertEqual(self.calls, 1)
+
+    async def test_cancelling_first_caller_does_not_cancel_others(self):
+        t1 = asyncio.create_task(self.client.health(want_obj=True))
+        await asyncio.sleep(0)
+        t2 = asyncio.create_task(self.client.health(want_obj=True))
+        await asyncio.sleep(0)
+        t1.cancel()
+        await asyncio.sleep(0)
+        self.release.set()
+        self.assertEqual(await t2, {"status": "healthy"})
+        self.assertFalse(t2.cancelled())
+        self.assertTrue(t1.cancelled())
+        self.assertEqual(self.calls, 1)
+
+
+class CacheInvalidationTest(unittest.IsolatedAsyncioTestCase):
+    """A GET that was on the wire during a write must not refill the cache with pre-write data."""
+
+    async def asyncSetUp(self):
+        self.count = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                seen = self.count  # the server answers with the state at the time of the request
+                self.started.set()
+                if not self.release.is_set():
+                    await self.release.wait()
+                return httpx.Response(200, json={"count": seen})
+            self.count += 1
+            return httpx.Response(200, json={"status": "success"})
+
+        self.client = LightRagHttpClient(base_url="http://lightrag", api_key="")
+        await self.client.client.aclose()
+        self.client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_read_started_before_write_is_not_cached(self):
+        before = asyncio.create_task(self.client.status_counts(want_obj=True))
+        await self.started.wait()
+        await self.client.insert_text("hello")
+        self.release.set()
+        self.assertEqual(await before, {"count": 0})
+        self.assertEqual(await self.client.status_counts(want_obj=True), {"count": 1})
+
+    async def test_read_after_write_does_not_join_earlier_request(self):
+        before = asyncio.create_task(self.client.status_counts(want_obj=True))
+        await self.started.wait()
+        await self.client.insert_text("hello")
+        after = asyncio.create_task(self.client.status_counts(want_obj=True))
+        await asyncio.sleep(0)
+        self.release.set()
+        self.assertEqual(await before, {"count": 0})
+        self.assertEqual(await after, {"count": 1})
+
+    async def test_pipeline_status_poll_during_batched_insert(self):
+        before = asyncio.create_task(self.client.pipeline_status(want_obj=True))
+        await self.started.wait()
+        await self.client.insert_text("hello", batch=True)
+        self.release.set()
+        await before
+        self.assertEqual(await self.client.pipeline_status(want_obj=True), {"count": 1})
+
+    async def test_entity_exists_during_delete_entity(self):
+        before = asyncio.create_task(self.client.entity_exists("Apple", want_obj=True))
+        await self.started.wait()
+        await self.client.delete_entity("Apple")
+        self.release.set()
+        await before
+        self.assertEqual(await self.client.entity_exists("Apple", want_obj=True), {"count": 1})
+
+
+class RevalidationTest(unittest.IsolatedAsyncioTestCase):
+    """ETag revalidation of the LRU response cache (see LightRagHttpClient._fetch_get)."""
+
+    async def asyncSetUp(self):
+        self.version = 0
+        self.revalidating = asyncio.Event()
+        self.release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method != "GET":
+                self.version += 1
+                return httpx.Response(200, json={"status": "success"})
+            etag = f'"{self.version}"'
+            if request.headers.get("if-none-match") == etag:
+                self.revalidating.set()
+                await self.release.wait()
+                return httpx.Response(304, headers={"etag": etag})
+            return httpx.Response(200, json={"version": self.version}, headers={"etag": etag})
+
+        self.client = LightRagHttpClient(base_url="http://lightrag", api_key="")
+        await self.client.client.aclose()
+        self.client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    def expire_cache(self):
+        for key, (_, r) in self.client._cache.items():
+            self.client._cache[key] = (0.0, r)
+
+    async def test_not_modified_reuses_cached_body(self):
+        self.release.set()
+        self.assertEqual(await self.client.status_counts(want_obj=True), {"version": 0})
+        self.expire_cache()
+        self.assertEqual(await self.client.status_counts(want_obj=True), {"version": 0})
+        self.assertTrue(self.revalidating.is_set())
+
+    async def test_not_modified_during_write_is_not_stored(self):
+        await self.client.status_counts(want_obj=True)
+        self.expire_cache()
+        before = asyncio.create_task(self.client.status_counts(want_obj=True))
+        await self.revalidating.wait()
+        await self.client.insert_text("hello")
+        self.release.set()
+        self.assertEqual(await before, {"version": 0})
+        self.assertEqual(await self.client.status_counts(want_obj=True), {"version": 1})
+
+
+class InsertTextsTest(unittest.IsolatedAsyncioTestCase):
+    """Large insert_texts batches are sent as parallel chunks."""
+
+    async def asyncSetUp(self):
+        self.sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            texts = orjson.loads(request.content)["texts"]
+            self.sent.append(texts)
+            if texts[0] == "t2":
+                return httpx.Response(500)
+            return httpx.Response(200, json={"status": "success", "track_id": texts[0]})
+
+        self.client = LightRagHttpClient(base_url="http://lightrag", api_key="")
+        await self.client.client.aclose()
+        self.client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_failed_chunk_keeps_other_results(self):
+        texts = [f"t{i}" for i in range(5)]
+        results = await self.client.insert_texts(texts, chunk_size=2, want_obj=True)
+        self.assertEqual(results[0], {"status": "success", "track_id": "t0"})
+        self.assertIn("error", results[1])
+        self.assertEqual(results[2], {"status": "success", "track_id": "t4"})
+
+    async def test_mismatched_file_sources_are_rejected_before_sending(self):
+        with self.assertRaises(ValueError):
+            await self.client.insert_texts(["a", "b", "c"], ["a.txt"], chunk_size=2)
+        self.assertEqual(self.sent, [])
+
+
+class QueryStreamTest(unittest.IsolatedAsyncioTestCase):
+    """query_stream_text returns the same text as joining the query_stream lines."""
+
+    async def test_text_matches_streamed_lines(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"response":"a"}\r\n\n{"response":"b"}\n\n')
+
+        client = LightRagHttpClient(base_url="http://lightrag", api_key="")
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            lines = [line async for line in client.query_stream({"query": "q"})]
+            text = await client.query_stream_text({"query": "q"})
+        finally:
+            await client.aclose()
+        self.assertEqual(text, "\n".join(lines))
+        self.assertEqual(text, '{"response":"a"}\n{"response":"b"}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,370 +1,403 @@
 from mcp.types import Tool
-from models import QueryRequest
+from models import query_request_schema
 
-def list_tools(enabled_tools: list[str] | None = None) -> list[Tool]:
-    """Return a list of Tool objects, optionally filtered by name."""
-    all_tools = [
-        # ---------------- system & auth ----------------
-        Tool(
-            name="health",
-            description=(
-                "Get current system status (GET /health).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+# Generated once for both query and query_stream
+_QUERY_SCHEMA = query_request_schema()
+
+# Built once at import; tool definitions never change while the server runs
+_TOOLS: list[Tool] = [
+    # ---------------- system & auth ----------------
+    Tool(
+        name="health",
+        description=(
+            "Get current system status (GET /health).\n"
+            "Example input: {}"
+        ),
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="auth_status",
+        description=(
+            "Get authentication status and guest token if auth is not configured (GET /auth-status).\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="auth_status",
-            description=(
-                "Get authentication status and guest token if auth is not configured (GET /auth-status).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="auth_login",
+        description=(
+            "Login via OAuth2 password flow (POST /login). Stores Bearer token in-session.\n"
+            "Example input: {\"username\":\"admin\", \"password\":\"secret\"}"
         ),
-        Tool(
-            name="auth_login",
-            description=(
-                "Login via OAuth2 password flow (POST /login). Stores Bearer token in-session.\n"
-                "Example input: {\"username\":\"admin\", \"password\":\"secret\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "username": {"type": "string"},
-                    "password": {"type": "string"},
-                    "scope": {"type": "string", "default": ""},
-                },
-                "required": ["username", "password"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "username": {"type": "string"},
+                "password": {"type": "string"},
+                "scope": {"type": "string", "default": ""},
             },
+            "required": ["username", "password"],
+        },
+    ),
+    # ---------------- documents -------------------
+    Tool(
+        name="documents_scan",
+        description=(
+            "Trigger scanning the input directory (POST /documents/scan).\n"
+            "Example input: {}"
         ),
-        # ---------------- documents -------------------
-        Tool(
-            name="documents_scan",
-            description=(
-                "Trigger scanning the input directory (POST /documents/scan).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="documents_upload_file",
+        description=(
+            "Upload **one** file to input dir and index it (POST /documents/upload).\n"
+            "Example input: {\"file_path\": \"/path/to/file.pdf\"}"
         ),
-        Tool(
-            name="documents_upload_file",
-            description=(
-                "Upload **one** file to input dir and index it (POST /documents/upload).\n"
-                "Example input: {\"file_path\": \"/path/to/file.pdf\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {"file_path": {"type": "string"}},
-                "required": ["file_path"],
-            },
+        inputSchema={
+            "type": "object",
+            "properties": {"file_path": {"type": "string"}},
+            "required": ["file_path"],
+        },
+    ),
+    Tool(
+        name="documents_upload_files",
+        description=(
+            "Upload multiple files (calls /documents/upload once per file).\n"
+            "Example input: {\"file_paths\":[\"/a.pdf\", \"/b.md\"]}"
         ),
-        Tool(
-            name="documents_upload_files",
-            description=(
-                "Upload multiple files (calls /documents/upload once per file).\n"
-                "Example input: {\"file_paths\":[\"/a.pdf\", \"/b.md\"]}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_paths": {"type": "array", "items": {"type": "string"}},
-                },
-                "required": ["file_paths"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_paths": {"type": "array", "items": {"type": "string"}},
             },
+            "required": ["file_paths"],
+        },
+    ),
+    Tool(
+        name="documents_insert_text",
+        description=(
+            "Insert a single text (POST /documents/texts). Calls arriving within 50 ms of each other are\n"
+            "sent together in one request, so the response describes the whole batch (e.g. its message\n"
+            "counts every text in it) and its track_id is shared by all texts in that batch.\n"
+            "Example input: {\"text\":\"hello\", \"file_source\":\"notes.txt\"}"
         ),
-        Tool(
-            name="documents_insert_text",
-            description=(
-                "Insert a single text (POST /documents/text).\n"
-                "Example input: {\"text\":\"hello\", \"file_source\":\"notes.txt\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string"},
-                    "file_source": {"type": "string"},
-                },
-                "required": ["text"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string"},
+                "file_source": {"type": "string"},
             },
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="documents_insert_texts",
+        description=(
+            "Insert multiple texts (POST /documents/texts). Lists longer than chunk_size are sent as\n"
+            "parallel requests of chunk_size texts and return one result per request; a failed request\n"
+            "yields {\"error\": ...} in its place. file_sources, if given, needs one entry per text.\n"
+            "Example input: {\"texts\":[\"a\",\"b\"], \"file_sources\":[\"a.txt\",\"b.txt\"]}"
         ),
-        Tool(
-            name="documents_insert_texts",
-            description=(
-                "Insert multiple texts (POST /documents/texts).\n"
-                "Example input: {\"texts\":[\"a\",\"b\"], \"file_sources\":[\"a.txt\",\"b.txt\"]}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "texts": {"type": "array", "items": {"type": "string"}},
-                    "file_sources": {"type": "array", "items": {"type": "string"}},
-                },
-                "required": ["texts"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "texts": {"type": "array", "items": {"type": "string"}},
+                "file_sources": {"type": "array", "items": {"type": "string"}},
+                "chunk_size": {"type": "integer", "minimum": 1, "default": 128},
+                "concurrency": {"type": "integer", "minimum": 1, "default": 4},
             },
+            "required": ["texts"],
+        },
+    ),
+    Tool(
+        name="documents_clear_all",
+        description=(
+            "Clear ALL documents and files (DELETE /documents). Irreversible.\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="documents_clear_all",
-            description=(
-                "Clear ALL documents and files (DELETE /documents). Irreversible.\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="documents_list_statuses",
+        description=(
+            "List documents grouped by processing status (GET /documents).\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="documents_list_statuses",
-            description=(
-                "List documents grouped by processing status (GET /documents).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="documents_pipeline_status",
+        description=(
+            "Get pipeline status/progress (GET /documents/pipeline_status).\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="documents_pipeline_status",
-            description=(
-                "Get pipeline status/progress (GET /documents/pipeline_status).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="documents_delete_by_ids",
+        description=(
+            "Delete specific documents (DELETE /documents/delete_document).\n"
+            "Example input: {\"doc_ids\":[\"doc_123\"], \"delete_file\": false}"
         ),
-        Tool(
-            name="documents_delete_by_ids",
-            description=(
-                "Delete specific documents (DELETE /documents/delete_document).\n"
-                "Example input: {\"doc_ids\":[\"doc_123\"], \"delete_file\": false}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "doc_ids": {"type": "array", "items": {"type": "string"}},
-                    "delete_file": {"type": "boolean", "default": False},
-                },
-                "required": ["doc_ids"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "doc_ids": {"type": "array", "items": {"type": "string"}},
+                "delete_file": {"type": "boolean", "default": False},
             },
+            "required": ["doc_ids"],
+        },
+    ),
+    Tool(
+        name="documents_clear_cache",
+        description=(
+            "Clear LLM cache (POST /documents/clear_cache).\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="documents_clear_cache",
-            description=(
-                "Clear LLM cache (POST /documents/clear_cache).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="documents_delete_entity",
+        description=(
+            "Delete an entity from the KG (DELETE /documents/delete_entity).\n"
+            "Example input: {\"entity_name\":\"Apple Inc.\"}"
         ),
-        Tool(
-            name="documents_delete_entity",
-            description=(
-                "Delete an entity from the KG (DELETE /documents/delete_entity).\n"
-                "Example input: {\"entity_name\":\"Apple Inc.\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {"entity_name": {"type": "string"}},
-                "required": ["entity_name"],
-            },
+        inputSchema={
+            "type": "object",
+            "properties": {"entity_name": {"type": "string"}},
+            "required": ["entity_name"],
+        },
+    ),
+    Tool(
+        name="documents_delete_relation",
+        description=(
+            "Delete a relation from the KG (DELETE /documents/delete_relation).\n"
+            "Example input: {\"source_entity\":\"A\", \"target_entity\":\"B\"}"
         ),
-        Tool(
-            name="documents_delete_relation",
-            description=(
-                "Delete a relation from the KG (DELETE /documents/delete_relation).\n"
-                "Example input: {\"source_entity\":\"A\", \"target_entity\":\"B\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source_entity": {"type": "string"},
-                    "target_entity": {"type": "string"},
-                },
-                "required": ["source_entity", "target_entity"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_entity": {"type": "string"},
+                "target_entity": {"type": "string"},
             },
+            "required": ["source_entity", "target_entity"],
+        },
+    ),
+    Tool(
+        name="documents_track_status",
+        description=(
+            "Track processing status by track_id (GET /documents/track_status/{track_id}).\n"
+            "Example input: {\"track_id\":\"upload_20250729_170612_abc123\"}"
         ),
-        Tool(
-            name="documents_track_status",
-            description=(
-                "Track processing status by track_id (GET /documents/track_status/{track_id}).\n"
-                "Example input: {\"track_id\":\"upload_20250729_170612_abc123\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {"track_id": {"type": "string"}},
-                "required": ["track_id"],
-            },
+        inputSchema={
+            "type": "object",
+            "properties": {"track_id": {"type": "string"}},
+            "required": ["track_id"],
+        },
+    ),
+    Tool(
+        name="documents_paginated",
+        description=(
+            "Paginated documents query (POST /documents/paginated).\n"
+            "Example input: {\"page\":1,\"page_size\":50,\"sort_field\":\"updated_at\",\"sort_direction\":\"desc\"}"
         ),
-        Tool(
-            name="documents_paginated",
-            description=(
-                "Paginated documents query (POST /documents/paginated).\n"
-                "Example input: {\"page\":1,\"page_size\":50,\"sort_field\":\"updated_at\",\"sort_direction\":\"desc\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "status_filter": {"type": "string", "enum": ["pending","processing","processed","failed"]},
-                    "page": {"type": "integer", "minimum": 1, "default": 1},
-                    "page_size": {"type": "integer", "minimum": 10, "maximum": 200, "default": 50},
-                    "sort_field": {"type": "string", "enum": ["created_at","updated_at","id","file_path"], "default": "updated_at"},
-                    "sort_direction": {"type": "string", "enum": ["asc","desc"], "default": "desc"},
-                },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "status_filter": {"type": "string", "enum": ["pending","processing","processed","failed"]},
+                "page": {"type": "integer", "minimum": 1, "default": 1},
+                "page_size": {"type": "integer", "minimum": 10, "maximum": 200, "default": 50},
+                "sort_field": {"type": "string", "enum": ["created_at","updated_at","id","file_path"], "default": "updated_at"},
+                "sort_direction": {"type": "string", "enum": ["asc","desc"], "default": "desc"},
             },
+        },
+    ),
+    Tool(
+        name="documents_status_counts",
+        description=(
+            "Counts of documents by status (GET /documents/status_counts).\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="documents_status_counts",
-            description=(
-                "Counts of documents by status (GET /documents/status_counts).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    # ---------------- query ----------------------
+    Tool(
+        name="query",
+        description=(
+            """RAG query (POST /query). Returns **structured output**: {request, response}.
+            Query Modes:
+              naive: Simple vector similarity search. Use for quick, general semantic search.
+              local: Entity-focused retrieval. Use for questions about a specific person, place, or thing.
+              global: Relationship-focused retrieval. Use for understanding connections between entities.
+              hybrid: Combined entity and relationship retrieval. Use for comprehensive answers.
+              mix: LLM-enhanced keyword retrieval. Use for complex queries.
+              bypass: Direct to LLM. Use for chatting directly with the LLM.
+            Other Important Parameters:
+              only_need_context: If True, returns the retrieved context without generating a response. Useful for debugging.
+              response_type: Defines the response format. Examples: 'Multiple Paragraphs', 'Single Paragraph', 'Bullet Points'.
+              top_k: Number of top items to retrieve from the knowledge graph.
+              chunk_top_k: Number of text chunks to retrieve from vector search.
+              conversation_history: A list of past user/assistant messages to maintain context.
+              user_prompt: A custom prompt to guide the LLM's response.
+              enable_rerank: If True, reranks the retrieved text chunks for better relevance.
+            Answers are not cached unless the server sets LIGHTRAG_QUERY_CACHE_TTL.
+            Example input: {"query":"Summarize recent docs", "mode":"hybrid", "top_k":5, "only_need_context": false}"""
         ),
-        # ---------------- query ----------------------
-        Tool(
-            name="query",
-            description=(
-                """RAG query (POST /query). Returns **structured output**: {request, response}.
-                Query Modes:
-                  naive: Simple vector similarity search. Use for quick, general semantic search.
-                  local: Entity-focused retrieval. Use for questions about a specific person, place, or thing.
-                  global: Relationship-focused retrieval. Use for understanding connections between entities.
-                  hybrid: Combined entity and relationship retrieval. Use for comprehensive answers.
-                  mix: LLM-enhanced keyword retrieval. Use for complex queries.
-                  bypass: Direct to LLM. Use for chatting directly with the LLM.
-                Other Important Parameters:
-                  only_need_context: If True, returns the retrieved context without generating a response. Useful for debugging.
-                  response_type: Defines the response format. Examples: 'Multiple Paragraphs', 'Single Paragraph', 'Bullet Points'.
-                  top_k: Number of top items to retrieve from the knowledge graph.
-                  chunk_top_k: Number of text chunks to retrieve from vector search.
-                  conversation_history: A list of past user/assistant messages to maintain context.
-                  user_prompt: A custom prompt to guide the LLM's response.
-                  enable_rerank: If True, reranks the retrieved text chunks for better relevance.
-                Example input: {"query":"Summarize recent docs", "mode":"hybrid", "top_k":5, "only_need_context": false}"""
-            ),
-            inputSchema=QueryRequest.model_json_schema(),
+        inputSchema=_QUERY_SCHEMA,
+    ),
+    Tool(
+        name="query_stream",
+        description=(
+            "Streamed RAG query (POST /query/stream). Returns **structured output**: {request, stream}.\n"
+            "Each streamed line is also sent as a progress notification when a progressToken is given.\n"
+            "Example input: {\"query\":\"Show citations\", \"mode\":\"hybrid\"}"
         ),
-        Tool(
-            name="query_stream",
-            description=(
-                "Streamed RAG query (POST /query/stream). Returns **structured output**: {request, stream}.\n"
-                "Example input: {\"query\":\"Show citations\", \"mode\":\"hybrid\"}"
-            ),
-            inputSchema=QueryRequest.model_json_schema(),
+        inputSchema=_QUERY_SCHEMA,
+    ),
+    # ---------------- graph ----------------------
+    Tool(
+        name="graph_labels",
+        description=(
+            "List graph labels (GET /graph/label/list).\n"
+            "Example input: {}"
         ),
-        # ---------------- graph ----------------------
-        Tool(
-            name="graph_labels",
-            description=(
-                "List graph labels (GET /graph/label/list).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="graphs_get",
+        description=(
+            "Retrieve subgraph by label (GET /graphs).\n"
+            "Example input: {\"label\":\"OpenAI\", \"max_depth\":3, \"max_nodes\":100}"
         ),
-        Tool(
-            name="graphs_get",
-            description=(
-                "Retrieve subgraph by label (GET /graphs).\n"
-                "Example input: {\"label\":\"OpenAI\", \"max_depth\":3, \"max_nodes\":100}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "label": {"type": "string"},
-                    "max_depth": {"type": "integer", "minimum": 1, "default": 3},
-                    "max_nodes": {"type": "integer", "minimum": 1, "default": 1000},
-                },
-                "required": ["label"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "label": {"type": "string"},
+                "max_depth": {"type": "integer", "minimum": 1, "default": 3},
+                "max_nodes": {"type": "integer", "minimum": 1, "default": 1000},
             },
+            "required": ["label"],
+        },
+    ),
+    Tool(
+        name="graph_entity_exists",
+        description=(
+            "Check if an entity exists (GET /graph/entity/exists).\n"
+            "Example input: {\"name\":\"Apple Inc.\"}"
         ),
-        Tool(
-            name="graph_entity_exists",
-            description=(
-                "Check if an entity exists (GET /graph/entity/exists).\n"
-                "Example input: {\"name\":\"Apple Inc.\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {"name": {"type": "string"}},
-                "required": ["name"],
-            },
+        inputSchema={
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="graph_update_entity",
+        description=(
+            "Update entity properties (POST /graph/entity/edit).\n"
+            "Example input: {\"entity_name\":\"Apple\", \"updated_data\":{\"aliases\":[\"Apple Inc\"]}, \"allow_rename\": false}"
         ),
-        Tool(
-            name="graph_update_entity",
-            description=(
-                "Update entity properties (POST /graph/entity/edit).\n"
-                "Example input: {\"entity_name\":\"Apple\", \"updated_data\":{\"aliases\":[\"Apple Inc\"]}, \"allow_rename\": false}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_name": {"type": "string"},
-                    "updated_data": {"type": "object", "additionalProperties": True},
-                    "allow_rename": {"type": "boolean", "default": False},
-                },
-                "required": ["entity_name", "updated_data"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_name": {"type": "string"},
+                "updated_data": {"type": "object", "additionalProperties": True},
+                "allow_rename": {"type": "boolean", "default": False},
             },
+            "required": ["entity_name", "updated_data"],
+        },
+    ),
+    Tool(
+        name="graph_update_relation",
+        description=(
+            "Update relation properties (POST /graph/relation/edit).\n"
+            "Example input: {\"source_id\":\"e1\", \"target_id\":\"e2\", \"updated_data\":{\"weight\":0.9}}"
         ),
-        Tool(
-            name="graph_update_relation",
-            description=(
-                "Update relation properties (POST /graph/relation/edit).\n"
-                "Example input: {\"source_id\":\"e1\", \"target_id\":\"e2\", \"updated_data\":{\"weight\":0.9}}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source_id": {"type": "string"},
-                    "target_id": {"type": "string"},
-                    "updated_data": {"type": "object", "additionalProperties": True},
-                },
-                "required": ["source_id", "target_id", "updated_data"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_id": {"type": "string"},
+                "target_id": {"type": "string"},
+                "updated_data": {"type": "object", "additionalProperties": True},
             },
+            "required": ["source_id", "target_id", "updated_data"],
+        },
+    ),
+    Tool(
+        name="graph_panel",
+        description=(
+            "Fetch graph labels, a subgraph and an entity-exists check in one call; the three\n"
+            "requests run concurrently (GET /graph/label/list, /graphs, /graph/entity/exists).\n"
+            "'name' defaults to 'label'.\n"
+            "Example input: {\"label\":\"OpenAI\", \"name\":\"OpenAI\", \"max_depth\":2, \"max_nodes\":100}"
         ),
-        # --------------- ollama-compatible -----------
-        Tool(
-            name="ollama_version",
-            description=(
-                "Get Ollama version info (GET /api/version).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "label": {"type": "string"},
+                "name": {"type": "string"},
+                "max_depth": {"type": "integer", "minimum": 1, "default": 3},
+                "max_nodes": {"type": "integer", "minimum": 1, "default": 1000},
+            },
+            "required": ["label"],
+        },
+    ),
+    # --------------- ollama-compatible -----------
+    Tool(
+        name="ollama_version",
+        description=(
+            "Get Ollama version info (GET /api/version).\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="ollama_tags",
-            description=(
-                "List available models (GET /api/tags).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="ollama_tags",
+        description=(
+            "List available models (GET /api/tags).\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="ollama_ps",
-            description=(
-                "List running models (GET /api/ps).\n"
-                "Example input: {}"
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="ollama_ps",
+        description=(
+            "List running models (GET /api/ps).\n"
+            "Example input: {}"
         ),
-        Tool(
-            name="ollama_generate",
-            description=(
-                "Direct completion to underlying LLM (POST /api/generate).\n"
-                "Example input: {\"model\":\"qwen\", \"prompt\":\"Hello\"}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {"payload": {"type": "object", "additionalProperties": True}},
-                "required": ["payload"],
-            },
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="ollama_generate",
+        description=(
+            "Direct completion to underlying LLM (POST /api/generate).\n"
+            "Example input: {\"model\":\"qwen\", \"prompt\":\"Hello\"}"
         ),
-        Tool(
-            name="ollama_chat",
-            description=(
-                "Chat completion (POST /api/chat).\n"
-                "Example input: {\"payload\": {\"model\":\"qwen\", \"messages\":[{\"role\":\"user\", \"content\":\"hi\"}]}}"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {"payload": {"type": "object", "additionalProperties": True}},
-                "required": ["payload"],
-            },
+        inputSchema={
+            "type": "object",
+            "properties": {"payload": {"type": "object", "additionalProperties": True}},
+            "required": ["payload"],
+        },
+    ),
+    Tool(
+        name="ollama_chat",
+        description=(
+            "Chat completion (POST /api/chat).\n"
+            "Example input: {\"payload\": {\"model\":\"qwen\", \"messages\":[{\"role\":\"user\", \"content\":\"hi\"}]}}"
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {"payload": {"type": "object", "additionalProperties": True}},
+            "required": ["payload"],
+        },
+    ),
+]
+
+def list_tools(enabled_tools: list[str] | None = None) -> list[Tool]:
+    """Return a list of Tool objects, optionally filtered by name."""
     if not enabled_tools:
-        return all_tools
+        return _TOOLS
     # Filter the tools based on the enabled_tools list
-    return [t for t in all_tools if t.name in enabled_tools]
\ No newline at end of file
+    enabled = set(enabled_tools)
+    return [t for t in _TOOLS if t.name in enabled]